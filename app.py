@@ -3,15 +3,19 @@ Streamlit demo app for an in-memory IT helpdesk ticketing system.
 """
 from __future__ import annotations
 
-from typing import Optional
+import itertools
+from typing import Optional, Tuple
 
 import streamlit as st
 
-from ticketing import Priority, Status, Ticket, TicketStore, format_timestamp
+from ticketing import Priority, Status, Ticket, TicketStore
 
 
 PRIORITY_OPTIONS = [Priority.LOW.value, Priority.MEDIUM.value, Priority.HIGH.value]
 STATUS_OPTIONS = [Status.OPEN.value, Status.RESOLVED.value]
+_STATUS_LOOKUP = {"All": None, **{s.value: s for s in Status}}
+_PRIORITY_LOOKUP = {"All": None, **{p.value: p for p in Priority}}
+BOARD_PAGE_SIZE = 50
 
 
 def get_ticket_store() -> TicketStore:
@@ -23,53 +27,57 @@ def get_ticket_store() -> TicketStore:
 
 def render_ticket(ticket: Ticket, store: TicketStore) -> None:
     """Render a single ticket and its resolution form if open."""
-    with st.expander(f"[#{ticket.id}] {ticket.subject} — {ticket.status.value}"):
-        st.markdown(
-            f"**Requester:** {ticket.requester}\n\n"
-            f"**Contact:** {ticket.contact}\n\n"
-            f"**Priority:** {ticket.priority.value}\n\n"
-            f"**Created:** {format_timestamp(ticket.created_at)}"
-        )
+    # ticket must be the store's own object (not a cache_data copy) so the memoized
+    # header and markdown strings survive into the next rerun.
+    with st.expander(ticket.header):
+        if ticket.status is Status.RESOLVED:
+            # Resolved tickets are read-only, so one markdown element covers them.
+            st.markdown(ticket.resolved_md)
+            return
+
+        st.markdown(ticket.summary_md)
         st.markdown("**Issue description**")
         st.write(ticket.description)
 
-        if ticket.status == Status.OPEN:
-            st.divider()
-            st.markdown("**Add resolution**")
-            resolution_text = st.text_area(
-                "Resolution notes",
-                placeholder="Document what resolved the issue",
-                key=f"resolution_{ticket.id}",
-            )
-            resolve_col1, _ = st.columns([1, 3])
-            with resolve_col1:
-                if st.button(
-                    "Resolve ticket",
-                    key=f"resolve_btn_{ticket.id}",
-                    type="primary",
-                    disabled=not resolution_text.strip(),
-                ):
-                    store.resolve_ticket(ticket.id, resolution_text)
-                    st.success("Ticket marked as resolved.")
-                    st.rerun()
-        else:
-            st.success("Resolved")
-            st.markdown(f"**Resolution:** {ticket.resolution}")
-            st.markdown(f"**Resolved:** {format_timestamp(ticket.resolved_at)}")
+        st.divider()
+        st.markdown("**Add resolution**")
+        resolution_text = st.text_area(
+            "Resolution notes",
+            placeholder="Document what resolved the issue",
+            key=f"resolution_{ticket.id}",
+        )
+        resolve_col1, _ = st.columns([1, 3])
+        with resolve_col1:
+            if st.button(
+                "Resolve ticket",
+                key=f"resolve_btn_{ticket.id}",
+                type="primary",
+                disabled=not resolution_text.strip(),
+            ):
+                store.resolve_ticket(ticket.id, resolution_text)
+                st.success("Ticket marked as resolved.")
+                st.rerun()
 
 
 def _parse_status_filter(selection: str) -> Optional[Status]:
-    if selection == "All":
-        return None
-    return Status(selection)
+    return _STATUS_LOOKUP[selection]
 
 
 def _parse_priority_filter(selection: str) -> Optional[Priority]:
-    if selection == "All":
-        return None
-    return Priority(selection)
+    return _PRIORITY_LOOKUP[selection]
+
+
+def _reset_board_limit() -> None:
+    st.session_state.pop("board_limit", None)
+
+
+def _load_more_tickets() -> None:
+    st.session_state.board_limit = (
+        st.session_state.get("board_limit", BOARD_PAGE_SIZE) + BOARD_PAGE_SIZE
+    )
 
 
+@st.experimental_fragment
 def render_ticket_board(store: TicketStore) -> None:
     """Render a list of tickets with optional filtering."""
     st.subheader("Ticket board")
@@ -80,26 +88,50 @@ def render_ticket_board(store: TicketStore) -> None:
     filter_col1, filter_col2 = st.columns(2)
     with filter_col1:
         status_filter = st.selectbox(
-            "Status", ["All", *STATUS_OPTIONS], index=0, key="status_filter"
+            "Status",
+            ["All", *STATUS_OPTIONS],
+            index=0,
+            key="status_filter",
+            on_change=_reset_board_limit,
         )
     with filter_col2:
         priority_filter = st.selectbox(
-            "Priority", ["All", *PRIORITY_OPTIONS], index=0, key="priority_filter"
+            "Priority",
+            ["All", *PRIORITY_OPTIONS],
+            index=0,
+            key="priority_filter",
+            on_change=_reset_board_limit,
         )
 
-    filtered_tickets = store.filter_tickets(
-        status=_parse_status_filter(status_filter),
-        priority=_parse_priority_filter(priority_filter),
+    # Not wrapped in st.cache_data: that would pickle the tickets and hand back copies
+    # on every hit. Pulling one ticket past the page tells us whether to offer more.
+    board_limit = st.session_state.get("board_limit", BOARD_PAGE_SIZE)
+    page = list(
+        itertools.islice(
+            store.iter_newest_first(
+                status=_parse_status_filter(status_filter),
+                priority=_parse_priority_filter(priority_filter),
+            ),
+            board_limit + 1,
+        )
     )
 
-    if not filtered_tickets:
+    if not page:
         st.info("No tickets match the selected filters.")
         return
 
-    for ticket in sorted(filtered_tickets, key=lambda t: t.created_at, reverse=True):
+    for ticket in page[:board_limit]:
         render_ticket(ticket, store)
 
+    if len(page) > board_limit:
+        st.button("Load more", key="board_load_more", on_click=_load_more_tickets)
+
 
+def _strip_all(*fields: str) -> Tuple[str, ...]:
+    return tuple(value.strip() for value in fields)
+
+
+@st.experimental_fragment
 def render_new_ticket_form(store: TicketStore) -> None:
     """Render the form for logging a new ticket."""
     st.subheader("Log a new ticket")
@@ -112,6 +144,9 @@ def render_new_ticket_form(store: TicketStore) -> None:
 
         submitted = st.form_submit_button("Submit ticket", type="primary")
         if submitted:
+            requester, contact, subject, description = _strip_all(
+                requester, contact, subject, description
+            )
             missing_fields = [
                 label
                 for label, value in {
@@ -120,7 +155,7 @@ def render_new_ticket_form(store: TicketStore) -> None:
                     "Subject": subject,
                     "Issue description": description,
                 }.items()
-                if not value.strip()
+                if not value
             ]
             if missing_fields:
                 st.error("Please complete all required fields before submitting.")
@@ -130,7 +165,8 @@ def render_new_ticket_form(store: TicketStore) -> None:
                     contact=contact,
                     subject=subject,
                     description=description,
-                    priority=Priority(priority),
+                    priority=_PRIORITY_LOOKUP[priority],
+                    strip=False,
                 )
                 st.success(f"Ticket #{ticket.id} has been logged.")
                 st.rerun()
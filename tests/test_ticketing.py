@@ -1,5 +1,5 @@
 import re
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
@@ -48,7 +48,8 @@ def test_resolve_ticket_updates_status_and_resolution_timestamp():
 
     assert resolved.status is Status.RESOLVED
     assert resolved.resolution == "Replaced the battery"
-    assert isinstance(resolved.resolved_at, datetime)
+    assert isinstance(resolved.resolved_at, float)
+    assert resolved.resolved_at >= resolved.created_at
 
 
 @pytest.mark.parametrize(
@@ -120,9 +121,371 @@ def test_stats_reports_total_open_resolved_counts():
 
 
 def test_format_timestamp_returns_dash_for_none_and_expected_format():
-    now = datetime(2024, 1, 1, 12, 0)
+    now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc).timestamp()
     assert format_timestamp(None) == "—"
 
     formatted = format_timestamp(now)
 
     assert re.match(r"^2024-01-01 12:00 UTC$", formatted)
+
+
+def test_get_ticket_finds_seeded_and_created_tickets_by_id():
+    store = TicketStore()
+    seeded = store.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    reloaded = TicketStore(store.tickets)
+
+    created = reloaded.create_ticket(
+        requester="B",
+        contact="b@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.HIGH,
+    )
+
+    assert reloaded.get_ticket(seeded.id) is seeded
+    assert reloaded.get_ticket(created.id) is created
+    assert reloaded.get_ticket(999) is None
+
+
+def test_stats_counts_seeded_tickets_and_ignores_repeat_resolutions():
+    seeded = TicketStore()
+    first = seeded.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    seeded.create_ticket(
+        requester="B",
+        contact="b@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    seeded.resolve_ticket(first.id, "Done")
+    store = TicketStore(seeded.tickets)
+
+    assert store.stats() == (2, 1, 1)
+
+    store.resolve_ticket(first.id, "Done again")
+
+    assert store.stats() == (2, 1, 1)
+
+
+def test_filtering_by_single_axis_preserves_creation_order():
+    store = TicketStore()
+    tickets = [
+        store.create_ticket(
+            requester=f"User {n}",
+            contact=f"user{n}@example.com",
+            subject="Issue",
+            description="Desc",
+            priority=priority,
+        )
+        for n, priority in enumerate(
+            [Priority.HIGH, Priority.LOW, Priority.HIGH, Priority.HIGH]
+        )
+    ]
+    store.resolve_ticket(tickets[3].id, "Done")
+    store.resolve_ticket(tickets[0].id, "Done")
+
+    assert store.filter_tickets(status=Status.RESOLVED) == [tickets[0], tickets[3]]
+    assert store.filter_tickets(status=Status.OPEN) == [tickets[1], tickets[2]]
+    assert store.filter_tickets(priority=Priority.HIGH) == [
+        tickets[0],
+        tickets[2],
+        tickets[3],
+    ]
+    assert store.filter_tickets() == tickets
+
+
+def test_revision_increments_on_create_and_resolve():
+    store = TicketStore()
+    assert store.revision == 0
+
+    ticket = store.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    assert store.revision == 1
+
+    store.resolve_ticket(ticket.id, "Done")
+    assert store.revision == 2
+
+
+def test_header_reflects_status_after_resolution():
+    store = TicketStore()
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject="Laptop issue",
+        description="Won't start",
+        priority=Priority.HIGH,
+    )
+
+    assert ticket.header == "[#1] Laptop issue — Open"
+    assert "**Requester:** Alice" in ticket.summary_md
+
+    store.resolve_ticket(ticket.id, "Replaced the battery")
+
+    assert ticket.header == "[#1] Laptop issue — Resolved"
+
+
+def test_tickets_snapshot_is_reused_until_the_store_changes():
+    store = TicketStore()
+    store.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    snapshot = store.tickets
+
+    assert isinstance(snapshot, tuple)
+    assert store.tickets is snapshot
+
+    store.create_ticket(
+        requester="B",
+        contact="b@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+
+    assert len(snapshot) == 1
+    assert len(store.tickets) == 2
+
+
+def test_create_tickets_assigns_contiguous_ids_and_indexes_batch():
+    store = TicketStore()
+    store.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+    revision = store.revision
+
+    created = store.create_tickets(
+        [
+            {
+                "requester": " B ",
+                "contact": "b@example.com",
+                "subject": "Sub",
+                "description": "Desc",
+                "priority": Priority.HIGH,
+            },
+            {
+                "requester": "C",
+                "contact": "c@example.com",
+                "subject": "Sub",
+                "description": "Desc",
+                "priority": Priority.LOW,
+            },
+        ]
+    )
+
+    assert [t.id for t in created] == [2, 3]
+    assert created[0].requester == "B"
+    assert store.revision == revision + 1
+    assert store.stats() == (3, 3, 0)
+    assert store.filter_tickets(priority=Priority.HIGH) == [created[0]]
+    assert store.get_ticket(3) is created[1]
+    assert store.create_tickets([]) == []
+    assert store.revision == revision + 1
+
+
+def test_unfiltered_view_is_a_copy_of_the_store():
+    store = TicketStore()
+    store.create_ticket(
+        requester="A",
+        contact="a@example.com",
+        subject="Sub",
+        description="Desc",
+        priority=Priority.LOW,
+    )
+
+    everything = store.filter_tickets()
+    everything.clear()
+
+    assert len(store.filter_tickets()) == 1
+    assert store.stats() == (1, 1, 0)
+
+
+def test_create_ticket_can_skip_trimming_prestripped_input():
+    store = TicketStore()
+
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject=" Laptop issue ",
+        description="Won't start",
+        priority=Priority.HIGH,
+        strip=False,
+    )
+
+    assert ticket.subject == " Laptop issue "
+
+
+def test_resolved_markdown_combines_details_and_tracks_re_resolution():
+    store = TicketStore()
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject="Laptop issue",
+        description="Won't start",
+        priority=Priority.HIGH,
+    )
+    store.resolve_ticket(ticket.id, "Replaced the battery")
+
+    assert ticket.resolved_md.startswith(ticket.summary_md)
+    assert "Won't start" in ticket.resolved_md
+    assert "**Resolution:** Replaced the battery" in ticket.resolved_md
+
+    store.resolve_ticket(ticket.id, "Replaced the charger")
+
+    assert "**Resolution:** Replaced the charger" in ticket.resolved_md
+
+
+def test_seeded_store_orders_tickets_and_buckets_by_id():
+    source = TicketStore()
+    first, second, third = source.create_tickets(
+        {
+            "requester": name,
+            "contact": f"{name.lower()}@example.com",
+            "subject": "Sub",
+            "description": "Desc",
+            "priority": Priority.LOW,
+        }
+        for name in ("A", "B", "C")
+    )
+    source.resolve_ticket(third.id, "Done")
+    source.resolve_ticket(first.id, "Done")
+
+    store = TicketStore([third, first, second])
+
+    assert store.filter_tickets() == [first, second, third]
+    assert store.filter_tickets(status=Status.RESOLVED) == [first, third]
+
+    store.resolve_ticket(second.id, "Done")
+
+    assert store.filter_tickets(status=Status.RESOLVED, priority=Priority.LOW) == [
+        first,
+        second,
+        third,
+    ]
+
+
+def test_header_memo_persists_on_tickets_returned_by_the_store():
+    store = TicketStore()
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject="Laptop issue",
+        description="Won't start",
+        priority=Priority.HIGH,
+    )
+
+    header = store.filter_tickets()[0].header
+    summary = store.filter_tickets(status=Status.OPEN)[0].summary_md
+
+    assert store.filter_tickets(priority=Priority.HIGH)[0] is ticket
+    assert store.get_ticket(ticket.id).header is header
+    assert store.get_ticket(ticket.id).summary_md is summary
+
+
+def test_resolved_markdown_is_memoized_on_the_store_ticket():
+    store = TicketStore()
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject="Laptop issue",
+        description="Won't start",
+        priority=Priority.HIGH,
+    )
+    store.resolve_ticket(ticket.id, "Replaced the battery")
+
+    rendered = store.filter_tickets(status=Status.RESOLVED)[0].resolved_md
+
+    assert store.get_ticket(ticket.id).resolved_md is rendered
+
+
+def test_iter_newest_first_yields_matches_in_reverse_creation_order():
+    store = TicketStore()
+    tickets = store.create_tickets(
+        {
+            "requester": f"User {n}",
+            "contact": f"user{n}@example.com",
+            "subject": "Issue",
+            "description": "Desc",
+            "priority": priority,
+        }
+        for n, priority in enumerate(
+            [Priority.HIGH, Priority.LOW, Priority.HIGH, Priority.HIGH]
+        )
+    )
+    store.resolve_ticket(tickets[3].id, "Done")
+    store.resolve_ticket(tickets[0].id, "Done")
+
+    assert list(store.iter_newest_first()) == tickets[::-1]
+    assert list(store.iter_newest_first(status=Status.RESOLVED)) == [tickets[3], tickets[0]]
+    assert list(store.iter_newest_first(priority=Priority.HIGH)) == [
+        tickets[3],
+        tickets[2],
+        tickets[0],
+    ]
+    assert list(store.iter_newest_first(status=Status.OPEN, priority=Priority.HIGH)) == [
+        tickets[2]
+    ]
+
+
+def test_format_timestamp_truncates_to_the_minute():
+    start = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+    assert format_timestamp(start + 59.9) == "2024-01-01 12:00 UTC"
+    assert format_timestamp(start + 60) == "2024-01-01 12:01 UTC"
+
+
+def test_summary_memo_survives_resolution():
+    store = TicketStore()
+    ticket = store.create_ticket(
+        requester="Alice",
+        contact="alice@example.com",
+        subject="Laptop issue",
+        description="Won't start",
+        priority=Priority.HIGH,
+    )
+    summary = ticket.summary_md
+
+    store.resolve_ticket(ticket.id, "Replaced the battery")
+
+    assert ticket.summary_md is summary
+
+
+def test_create_tickets_honours_strip_flag_like_create_ticket():
+    store = TicketStore()
+    payload = {
+        "requester": " Alice ",
+        "contact": "alice@example.com",
+        "subject": " Laptop issue ",
+        "description": "Won't start",
+        "priority": Priority.HIGH,
+    }
+
+    [trimmed] = store.create_tickets([payload])
+    [untouched] = store.create_tickets([payload], strip=False)
+
+    assert trimmed.subject == "Laptop issue"
+    assert untouched.subject == " Laptop issue "
@@ -5,10 +5,13 @@ This module is streamlit-agnostic to enable straightforward unit testing.
 """
 from __future__ import annotations
 
+import bisect
+import functools
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 
 class Status(str, Enum):
@@ -22,9 +25,9 @@ class Priority(str, Enum):
     HIGH = "High"
 
 
-@dataclass
+@dataclass(slots=True)
 class Ticket:
-    """Simple ticket model."""
+    """Simple ticket model; timestamps are UTC epoch seconds."""
 
     id: int
     requester: str
@@ -33,9 +36,43 @@ class Ticket:
     description: str
     priority: Priority
     status: Status = Status.OPEN
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: float = field(default_factory=time.time)
     resolution: Optional[str] = None
-    resolved_at: Optional[datetime] = None
+    resolved_at: Optional[float] = None
+    _header: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _summary_md: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _resolved_md: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def header(self) -> str:
+        """Expander title, built on first access and reset when the ticket is resolved."""
+        if self._header is None:
+            self._header = f"[#{self.id}] {self.subject} — {self.status.value}"
+        return self._header
+
+    @property
+    def summary_md(self) -> str:
+        """Markdown block with requester, contact, priority and creation time."""
+        if self._summary_md is None:
+            self._summary_md = (
+                f"**Requester:** {self.requester}\n\n"
+                f"**Contact:** {self.contact}\n\n"
+                f"**Priority:** {self.priority.value}\n\n"
+                f"**Created:** {format_timestamp(self.created_at)}"
+            )
+        return self._summary_md
+
+    @property
+    def resolved_md(self) -> str:
+        """Complete read-only markdown for a resolved ticket, rendered as a single element."""
+        if self._resolved_md is None:
+            self._resolved_md = (
+                f"{self.summary_md}\n\n"
+                f"**Issue description**\n\n{self.description}\n\n"
+                f"**Resolution:** {self.resolution}\n\n"
+                f"**Resolved:** {format_timestamp(self.resolved_at)}"
+            )
+        return self._resolved_md
 
     def resolve(self, resolution: str) -> None:
         """Resolve a ticket with the provided resolution notes."""
@@ -43,69 +80,192 @@ class Ticket:
             raise ValueError("Resolution cannot be empty")
         self.status = Status.RESOLVED
         self.resolution = resolution.strip()
-        self.resolved_at = datetime.utcnow()
+        self.resolved_at = time.time()
+        # The summary covers only fields that resolving leaves untouched, so it stays valid.
+        self._header = None
+        self._resolved_md = None
 
 
 class TicketStore:
     """In-memory store for tickets with predictable ID assignment."""
 
     def __init__(self, tickets: Optional[Sequence[Ticket]] = None) -> None:
-        self._tickets: List[Ticket] = list(tickets) if tickets else []
-        self._next_id: int = self._compute_next_id()
+        # Ids are assigned in creation order, so id order is chronological order.
+        self._tickets: List[Ticket] = sorted(tickets, key=lambda t: t.id) if tickets else []
+        self._by_id: Dict[int, Ticket] = {t.id: t for t in self._tickets}
+        self._open_count: int = sum(1 for t in self._tickets if t.status is Status.OPEN)
+        # Open tickets leave their bucket on resolve, so they live in an id-keyed dict
+        # (ordered, O(1) removal). Resolved tickets never leave, so a sorted id list
+        # maintained with bisect keeps that bucket in creation order.
+        self._open: Dict[int, Ticket] = {}
+        self._resolved_ids: List[int] = []
+        self._by_priority: Dict[Priority, Dict[int, Ticket]] = {p: {} for p in Priority}
+        for ticket in self._tickets:
+            if ticket.status is Status.OPEN:
+                self._open[ticket.id] = ticket
+            else:
+                self._resolved_ids.append(ticket.id)
+            self._by_priority[ticket.priority][ticket.id] = ticket
+        self._next_id: int = max((t.id for t in self._tickets), default=0) + 1
+        self._revision: int = 0
+        self._tickets_snapshot: Tuple[Ticket, ...] = ()
+        self._snapshot_rev: int = -1
 
-    def _compute_next_id(self) -> int:
-        if not self._tickets:
-            return 1
-        return max(ticket.id for ticket in self._tickets) + 1
+    @property
+    def revision(self) -> int:
+        """Counter bumped on every mutation, usable as a cache key for derived views."""
+        return self._revision
 
     @property
-    def tickets(self) -> List[Ticket]:
-        return list(self._tickets)
+    def tickets(self) -> Tuple[Ticket, ...]:
+        """Immutable snapshot of all tickets, rebuilt only after the store changes."""
+        if self._snapshot_rev != self._revision:
+            self._tickets_snapshot = tuple(self._tickets)
+            self._snapshot_rev = self._revision
+        return self._tickets_snapshot
 
     def create_ticket(
-        self, requester: str, contact: str, subject: str, description: str, priority: Priority
+        self,
+        requester: str,
+        contact: str,
+        subject: str,
+        description: str,
+        priority: Priority,
+        *,
+        strip: bool = True,
     ) -> Ticket:
-        ticket = Ticket(
-            id=self._next_id,
-            requester=requester.strip(),
-            contact=contact.strip(),
-            subject=subject.strip(),
-            description=description.strip(),
-            priority=priority,
+        """Create and index a new ticket; pass ``strip=False`` for already-trimmed input."""
+        ticket = self._build_ticket(
+            self._next_id, strip, requester, contact, subject, description, priority
         )
-        self._tickets.append(ticket)
-        self._next_id += 1
+        self._add_tickets([ticket])
         return ticket
 
+    def create_tickets(
+        self, payloads: Iterable[Dict[str, Any]], *, strip: bool = True
+    ) -> List[Ticket]:
+        """Create tickets from ``create_ticket`` keyword payloads in one indexing pass."""
+        new_tickets = [
+            self._build_ticket(ticket_id, strip, **payload)
+            for ticket_id, payload in enumerate(payloads, start=self._next_id)
+        ]
+        if new_tickets:
+            self._add_tickets(new_tickets)
+        return new_tickets
+
+    @staticmethod
+    def _build_ticket(
+        ticket_id: int,
+        strip: bool,
+        requester: str,
+        contact: str,
+        subject: str,
+        description: str,
+        priority: Priority,
+    ) -> Ticket:
+        # The single place tickets are built, so both create paths trim the same way.
+        if strip:
+            requester, contact, subject, description = (
+                requester.strip(),
+                contact.strip(),
+                subject.strip(),
+                description.strip(),
+            )
+        return Ticket(
+            id=ticket_id,
+            requester=requester,
+            contact=contact,
+            subject=subject,
+            description=description,
+            priority=priority,
+        )
+
+    def _add_tickets(self, new_tickets: List[Ticket]) -> None:
+        # The sole path for adding tickets. Ids and created_at only ever grow here,
+        # so list order is chronological order.
+        self._tickets.extend(new_tickets)
+        for ticket in new_tickets:
+            self._by_id[ticket.id] = ticket
+            self._open[ticket.id] = ticket
+            self._by_priority[ticket.priority][ticket.id] = ticket
+        self._open_count += len(new_tickets)
+        self._next_id = new_tickets[-1].id + 1
+        self._revision += 1
+
     def resolve_ticket(self, ticket_id: int, resolution: str) -> Ticket:
         ticket = self.get_ticket(ticket_id)
         if ticket is None:
             raise ValueError(f"Ticket {ticket_id} not found")
+        was_open = ticket.status is Status.OPEN
         ticket.resolve(resolution)
+        if was_open:
+            self._open_count -= 1
+            del self._open[ticket.id]
+            bisect.insort(self._resolved_ids, ticket.id)
+        self._revision += 1
         return ticket
 
     def get_ticket(self, ticket_id: int) -> Optional[Ticket]:
-        return next((t for t in self._tickets if t.id == ticket_id), None)
+        return self._by_id.get(ticket_id)
 
     def filter_tickets(
         self, status: Optional[Status] = None, priority: Optional[Priority] = None
     ) -> List[Ticket]:
-        return [
-            t
-            for t in self._tickets
-            if (status is None or t.status == status)
-            and (priority is None or t.priority == priority)
-        ]
+        if status is None and priority is None:
+            return list(self._tickets)
+        return list(self._iter_filtered(status, priority, iter))
+
+    def iter_newest_first(
+        self, status: Optional[Status] = None, priority: Optional[Priority] = None
+    ) -> Iterator[Ticket]:
+        """Lazily yield matching tickets newest first, so callers can stop after a page.
+
+        The iterator walks the store's live indexes, so do not create or resolve tickets
+        until it is exhausted; materialise the page first (e.g. ``list(islice(...))``).
+        """
+        return self._iter_filtered(status, priority, reversed)
+
+    def _iter_filtered(
+        self,
+        status: Optional[Status],
+        priority: Optional[Priority],
+        order: Callable[[Any], Iterator[Any]],
+    ) -> Iterator[Ticket]:
+        if priority is None:
+            if status is None:
+                return order(self._tickets)
+            return self._iter_status(status, order)
+        priority_bucket = self._by_priority[priority]
+        if status is None:
+            return order(priority_bucket.values())
+        # Walk whichever bucket is smaller and test the other axis on the ticket itself.
+        if self._status_count(status) < len(priority_bucket):
+            return (t for t in self._iter_status(status, order) if t.priority is priority)
+        return (t for t in order(priority_bucket.values()) if t.status is status)
+
+    def _iter_status(
+        self, status: Status, order: Callable[[Any], Iterator[Any]]
+    ) -> Iterator[Ticket]:
+        if status is Status.OPEN:
+            return order(self._open.values())
+        return map(self._by_id.__getitem__, order(self._resolved_ids))
+
+    def _status_count(self, status: Status) -> int:
+        return self._open_count if status is Status.OPEN else len(self._resolved_ids)
 
     def stats(self) -> tuple[int, int, int]:
         total = len(self._tickets)
-        open_count = len([t for t in self._tickets if t.status == Status.OPEN])
-        resolved_count = total - open_count
-        return total, open_count, resolved_count
+        return total, self._open_count, total - self._open_count
 
 
-def format_timestamp(timestamp: Optional[datetime]) -> str:
-    """Return a human-friendly timestamp string for display."""
+def format_timestamp(timestamp: Optional[float]) -> str:
+    """Return a human-friendly string for an epoch timestamp."""
     if timestamp is None:
         return "—"
-    return timestamp.strftime("%Y-%m-%d %H:%M UTC")
+    # The output has minute precision, so cache per minute rather than per unique float.
+    return _format_minute(int(timestamp // 60))
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60, tz=timezone.utc).strftime("%Y-%m-%d %H:%M UTC")